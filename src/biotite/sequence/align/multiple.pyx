@@ -10,6 +10,9 @@ cimport cython
 cimport numpy as np
 from libc.math cimport log
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import numpy as np
 from .matrix import SubstitutionMatrix
 from .alignment import Alignment
@@ -64,11 +67,11 @@ class GapSymbol:
 
 
 def align_multiple(sequences, matrix, gap_penalty=-10, terminal_penalty=True,
-                   distances=None, guide_tree=None):
+                   distances=None, guide_tree=None, threads=None):
     r"""
     align_multiple(sequences, matrix, gap_penalty=-10,
                    terminal_penalty=True, distances=None,
-                   guide_tree=None)
+                   guide_tree=None, threads=None)
     
     Perform a multiple sequence alignment using a progressive
     alignment algorithm. [1]_
@@ -109,6 +112,11 @@ def align_multiple(sequences, matrix, gap_penalty=-10, terminal_penalty=True,
         The guide tree to be used for the progressive alignment.
         By default the guide tree is constructed from `distances`
         via the UPGMA clustering method.
+    threads : int, optional
+        The number of threads used for the pairwise alignments, that
+        are required for the calculation of `distances`.
+        By default, the number of CPUs is used.
+        Ignored, if `distances` is given.
 
     Returns
     -------
@@ -230,8 +238,12 @@ def align_multiple(sequences, matrix, gap_penalty=-10, terminal_penalty=True,
     # Template parameter workaround
     _T = sequences[0].code
     if distances is None:
+        if threads is None:
+            threads = os.cpu_count() or 1
+        elif threads < 1:
+            raise ValueError("At least one thread is required")
         distances = _get_distance_matrix(
-            _T, sequences, matrix, gap_penalty, terminal_penalty
+            _T, sequences, matrix, gap_penalty, terminal_penalty, threads
         )
     else:
         distances = distances.astype(np.float32, copy=True)
@@ -293,7 +305,7 @@ def align_multiple(sequences, matrix, gap_penalty=-10, terminal_penalty=True,
 
 
 def _get_distance_matrix(CodeType[:] _T, sequences, matrix,
-                         gap_penalty, terminal_penalty):
+                         gap_penalty, terminal_penalty, threads):
     """
     Create all pairwise alignments for the given sequences and use the
     method proposed by Feng & Doolittle to calculate the pairwise
@@ -314,6 +326,8 @@ def _get_distance_matrix(CodeType[:] _T, sequences, matrix,
     terminal_penalty : bool
         Whether to or not count terminal gap penalties for the
         alignments.
+    threads : int
+        The number of threads used for the pairwise alignments.
     
     Returns
     -------
@@ -328,18 +342,29 @@ def _get_distance_matrix(CodeType[:] _T, sequences, matrix,
     cdef np.ndarray alignments = np.full(
         (len(sequences), len(sequences)), None, dtype=object
     )
-    for i in range(len(sequences)):
-        # Inclusive range
-        for j in range(i+1):
-            # For this method we only consider one alignment:
-            # Score is equal for all alignments
-            # Alignment length is equal for most alignments
-            alignment = align_optimal(
-                sequences[i], sequences[j], matrix,
-                gap_penalty, terminal_penalty, max_number=1
-            )[0]
-            scores[i,j] = alignment.score
-            alignments[i,j] = alignment
+    # Inclusive range for j
+    pairs = [(i, j) for i in range(len(sequences)) for j in range(i+1)]
+    # For this method we only consider one alignment:
+    # Score is equal for all alignments
+    # Alignment length is equal for most alignments
+    align_pair = partial(
+        align_optimal, matrix=matrix, gap_penalty=gap_penalty,
+        terminal_penalty=terminal_penalty, max_number=1
+    )
+    seqs1 = [sequences[i] for i, _ in pairs]
+    seqs2 = [sequences[j] for _, j in pairs]
+    if threads == 1:
+        pair_alignments = list(map(align_pair, seqs1, seqs2))
+    else:
+        # The pairwise alignments are independent of each other and
+        # the alignment table filling releases the GIL
+        # -> parallelization via threads
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            pair_alignments = list(executor.map(align_pair, seqs1, seqs2))
+    for (i, j), alignment in zip(pairs, pair_alignments):
+        alignment = alignment[0]
+        scores[i,j] = alignment.score
+        alignments[i,j] = alignment
     
     ### Distance calculation from similarity scores ###
     # Calculate the occurences of each symbol code in each sequence
@@ -416,7 +416,7 @@ def _fill_align_table(CodeType1[:] code1 not None,
     """
     
     cdef int i, j
-    cdef int max_i, max_j
+    cdef int i_max, j_max
     cdef int32 from_diag, from_left, from_top
     cdef uint8 trace
     cdef int32 score
@@ -424,56 +424,60 @@ def _fill_align_table(CodeType1[:] code1 not None,
     # Used in case terminal gaps are not penalized
     i_max = score_table.shape[0] -1
     j_max = score_table.shape[1] -1
-    # Starts at 1 since the first row and column are already filled
-    for i in range(1, score_table.shape[0]):
-        for j in range(1, score_table.shape[1]):
-            # Evaluate score from diagonal direction
-            # -1 is in sequence index is necessary
-            # due to the shift of the sequences
-            # to the bottom/right in the table
-            from_diag = score_table[i-1, j-1] + matrix[code1[i-1], code2[j-1]]
-            # Evaluate score from left direction
-            if not term_penalty and i == i_max:
-                from_left = score_table[i, j-1]
-            else:
-                from_left = score_table[i, j-1] + gap_penalty
-            # Evaluate score from top direction
-            if not term_penalty and j == j_max:
-                from_top = score_table[i-1, j]
-            else:
-                from_top = score_table[i-1, j] + gap_penalty
-            
-            # Find maximum
-            if from_diag > from_left:
-                if from_diag > from_top:
-                    trace, score = 1, from_diag
-                elif from_diag == from_top:
-                    trace, score = 5, from_diag
+    # The table filling does not require the GIL
+    # -> alignments can be computed in parallel threads
+    with nogil:
+        # Starts at 1 since the first row and column are already filled
+        for i in range(1, score_table.shape[0]):
+            for j in range(1, score_table.shape[1]):
+                # Evaluate score from diagonal direction
+                # -1 is in sequence index is necessary
+                # due to the shift of the sequences
+                # to the bottom/right in the table
+                from_diag = score_table[i-1, j-1] \
+                            + matrix[code1[i-1], code2[j-1]]
+                # Evaluate score from left direction
+                if not term_penalty and i == i_max:
+                    from_left = score_table[i, j-1]
                 else:
-                    trace, score = 4, from_top
-            elif from_diag == from_left:
-                if from_diag > from_top:
-                    trace, score = 3, from_diag
-                elif from_diag == from_top:
-                    trace, score = 7, from_diag
+                    from_left = score_table[i, j-1] + gap_penalty
+                # Evaluate score from top direction
+                if not term_penalty and j == j_max:
+                    from_top = score_table[i-1, j]
                 else:
-                    trace, score =  4, from_top
-            else:
-                if from_left > from_top:
-                    trace, score = 2, from_left
-                elif from_left == from_top:
-                    trace, score = 6, from_diag
+                    from_top = score_table[i-1, j] + gap_penalty
+            
+                # Find maximum
+                if from_diag > from_left:
+                    if from_diag > from_top:
+                        trace, score = 1, from_diag
+                    elif from_diag == from_top:
+                        trace, score = 5, from_diag
+                    else:
+                        trace, score = 4, from_top
+                elif from_diag == from_left:
+                    if from_diag > from_top:
+                        trace, score = 3, from_diag
+                    elif from_diag == from_top:
+                        trace, score = 7, from_diag
+                    else:
+                        trace, score =  4, from_top
                 else:
-                    trace, score = 4, from_top
+                    if from_left > from_top:
+                        trace, score = 2, from_left
+                    elif from_left == from_top:
+                        trace, score = 6, from_diag
+                    else:
+                        trace, score = 4, from_top
             
-            # Local alignment specialty:
-            # If score is less than or equal to 0,
-            # then 0 is saved on the field and the trace ends here
-            if local == True and score <= 0:
-                score_table[i,j] = 0
-            else:
-                score_table[i,j] = score
-                trace_table[i,j] = trace
+                # Local alignment specialty:
+                # If score is less than or equal to 0,
+                # then 0 is saved on the field and the trace ends here
+                if local == True and score <= 0:
+                    score_table[i,j] = 0
+                else:
+                    score_table[i,j] = score
+                    trace_table[i,j] = trace
 
 
 @cython.boundscheck(False)
@@ -521,7 +525,7 @@ def _fill_align_table_affine(CodeType1[:] code1 not None,
     """
     
     cdef int i, j
-    cdef int max_i, max_j
+    cdef int i_max, j_max
     cdef int32 mm_score, g1m_score, g2m_score
     cdef int32 mg1_score, g1g1_score
     cdef int32 mg2_score, g2g2_score
@@ -532,101 +536,104 @@ def _fill_align_table_affine(CodeType1[:] code1 not None,
     # Used in case terminal gaps are not penalized
     i_max = trace_table.shape[0] -1
     j_max = trace_table.shape[1] -1
-    # Starts at 1 since the first row and column are already filled
-    for i in range(1, trace_table.shape[0]):
-        for j in range(1, trace_table.shape[1]):
-            # Calculate the scores for possible transitions
-            # into the current cell
-            similarity = matrix[code1[i-1], code2[j-1]]
-            mm_score  =  m_table[i-1,j-1] + similarity
-            g1m_score = g1_table[i-1,j-1] + similarity
-            g2m_score = g2_table[i-1,j-1] + similarity
-            # No transition from g1_table to g2_table and vice versa
-            # Since this would mean adjacent gaps in both sequences
-            # A substitution makes more sense in this case
-            if not term_penalty and i == i_max:
-                mg1_score  =  m_table[i,j-1]
-                g1g1_score = g1_table[i,j-1]
-            else:
-                mg1_score  =  m_table[i,j-1] + gap_open
-                g1g1_score = g1_table[i,j-1] + gap_ext
-            if not term_penalty and j == j_max:
-                mg2_score  = m_table[i-1,j]
-                g2g2_score = g2_table[i-1,j]
-            else:
-                mg2_score  =  m_table[i-1,j] + gap_open
-                g2g2_score = g2_table[i-1,j] + gap_ext
+    # The table filling does not require the GIL
+    # -> alignments can be computed in parallel threads
+    with nogil:
+        # Starts at 1 since the first row and column are already filled
+        for i in range(1, trace_table.shape[0]):
+            for j in range(1, trace_table.shape[1]):
+                # Calculate the scores for possible transitions
+                # into the current cell
+                similarity = matrix[code1[i-1], code2[j-1]]
+                mm_score  =  m_table[i-1,j-1] + similarity
+                g1m_score = g1_table[i-1,j-1] + similarity
+                g2m_score = g2_table[i-1,j-1] + similarity
+                # No transition from g1_table to g2_table and vice versa
+                # Since this would mean adjacent gaps in both sequences
+                # A substitution makes more sense in this case
+                if not term_penalty and i == i_max:
+                    mg1_score  =  m_table[i,j-1]
+                    g1g1_score = g1_table[i,j-1]
+                else:
+                    mg1_score  =  m_table[i,j-1] + gap_open
+                    g1g1_score = g1_table[i,j-1] + gap_ext
+                if not term_penalty and j == j_max:
+                    mg2_score  = m_table[i-1,j]
+                    g2g2_score = g2_table[i-1,j]
+                else:
+                    mg2_score  =  m_table[i-1,j] + gap_open
+                    g2g2_score = g2_table[i-1,j] + gap_ext
             
-            # Find maximum score and trace
-            # (similar to general gap method)
-            # At first for match table (m_table)
-            if mm_score > g1m_score:
-                if mm_score > g2m_score:
-                    trace, m_score = 1, mm_score
-                elif mm_score == g2m_score:
-                    trace, m_score = 5, mm_score
+                # Find maximum score and trace
+                # (similar to general gap method)
+                # At first for match table (m_table)
+                if mm_score > g1m_score:
+                    if mm_score > g2m_score:
+                        trace, m_score = 1, mm_score
+                    elif mm_score == g2m_score:
+                        trace, m_score = 5, mm_score
+                    else:
+                        trace, m_score = 4, g2m_score
+                elif mm_score == g1m_score:
+                    if mm_score > g2m_score:
+                        trace, m_score = 3, mm_score
+                    elif mm_score == g2m_score:
+                        trace, m_score = 7, mm_score
+                    else:
+                        trace, m_score =  4, g2m_score
                 else:
-                    trace, m_score = 4, g2m_score
-            elif mm_score == g1m_score:
-                if mm_score > g2m_score:
-                    trace, m_score = 3, mm_score
-                elif mm_score == g2m_score:
-                    trace, m_score = 7, mm_score
+                    if g1m_score > g2m_score:
+                        trace, m_score = 2, g1m_score
+                    elif g1m_score == g2m_score:
+                        trace, m_score = 6, g1m_score
+                    else:
+                        trace, m_score = 4, g2m_score
+                #Secondly for gap tables (g1_table and g2_table)
+                if mg1_score > g1g1_score:
+                    trace |= 8
+                    g1_score = mg1_score
+                elif mg1_score < g1g1_score:
+                    trace |= 16
+                    g1_score = g1g1_score
                 else:
-                    trace, m_score =  4, g2m_score
-            else:
-                if g1m_score > g2m_score:
-                    trace, m_score = 2, g1m_score
-                elif g1m_score == g2m_score:
-                    trace, m_score = 6, g1m_score
+                    trace |= 24
+                    g1_score = mg1_score
+                if mg2_score > g2g2_score:
+                    trace |= 32
+                    g2_score = mg2_score
+                elif mg2_score < g2g2_score:
+                    trace |= 64
+                    g2_score = g2g2_score
                 else:
-                    trace, m_score = 4, g2m_score
-            #Secondly for gap tables (g1_table and g2_table)
-            if mg1_score > g1g1_score:
-                trace |= 8
-                g1_score = mg1_score
-            elif mg1_score < g1g1_score:
-                trace |= 16
-                g1_score = g1g1_score
-            else:
-                trace |= 24
-                g1_score = mg1_score
-            if mg2_score > g2g2_score:
-                trace |= 32
-                g2_score = mg2_score
-            elif mg2_score < g2g2_score:
-                trace |= 64
-                g2_score = g2g2_score
-            else:
-                trace |= 96
-                g2_score = g2g2_score
-            # Fill values into tables
-            # Local alignment specialty:
-            # If score is less than or equal to 0,
-            # then 0 is saved on the field and the trace ends here
-            if local == True:
-                if m_score <= 0:
-                    m_table[i,j] = 0
-                    # End trace in specific table
-                    # by filtering the the bits of other tables  
-                    trace &= ~7
+                    trace |= 96
+                    g2_score = g2g2_score
+                # Fill values into tables
+                # Local alignment specialty:
+                # If score is less than or equal to 0,
+                # then 0 is saved on the field and the trace ends here
+                if local == True:
+                    if m_score <= 0:
+                        m_table[i,j] = 0
+                        # End trace in specific table
+                        # by filtering the the bits of other tables  
+                        trace &= ~7
+                    else:
+                        m_table[i,j] = m_score
+                    if g1_score <= 0:
+                        g1_table[i,j] = 0
+                        trace &= ~24
+                    else:
+                        g1_table[i,j] = g1_score
+                    if g2_score <= 0:
+                        g2_table[i,j] = 0
+                        trace &= ~96
+                    else:
+                        g2_table[i,j] = g2_score
                 else:
                     m_table[i,j] = m_score
-                if g1_score <= 0:
-                    g1_table[i,j] = 0
-                    trace &= ~24
-                else:
                     g1_table[i,j] = g1_score
-                if g2_score <= 0:
-                    g2_table[i,j] = 0
-                    trace &= ~96
-                else:
                     g2_table[i,j] = g2_score
-            else:
-                m_table[i,j] = m_score
-                g1_table[i,j] = g1_score
-                g2_table[i,j] = g2_score
-            trace_table[i,j] = trace
+                trace_table[i,j] = trace
 
 
 cdef void _follow_trace(uint8[:,:] trace_table,
@@ -103,6 +103,8 @@ class Alphabet(object):
         self._symbol_dict = {}
         for i, symbol in enumerate(symbols):
             self._symbol_dict[symbol] = i
+        # Used for fast decoding of single symbol codes in 'Sequence'
+        self._symbols_tuple = tuple(self._symbols)
     
     def get_symbols(self):
         """
@@ -218,7 +220,16 @@ class Alphabet(object):
         symbols : list
             The decoded list of symbols.
         """
-        return [self.decode(c) for c in code]
+        code = np.asarray(code)
+        # Check validity of all codes at once instead of calling
+        # 'decode()' for each symbol code
+        invalid_mask = (code < 0) | (code >= len(self._symbols))
+        if invalid_mask.any():
+            raise AlphabetError(
+                f"'{code[invalid_mask][0]:d}' is not a valid code"
+            )
+        symbols = self._symbols
+        return [symbols[c] for c in code.tolist()]
     
     def is_letter_alphabet(self):
         """
@@ -310,6 +321,30 @@ class LetterAlphabet(Alphabet):
             np.array(self._symbols, dtype="|S1"),
             dtype=np.ubyte
         )
+        # An array based map that maps from symbol to code:
+        # It is indexed with the ASCII value of a symbol
+        # The last symbol code of the alphabet + 1 is always illegal,
+        # since this code cannot occur from symbol encoding
+        # Hence, it is used to mark characters that are not part of
+        # the alphabet
+        # The map is created only once, since the alphabet is immutable
+        self._illegal_code = len(self._symbols)
+        self._symbol_to_code = np.full(
+            256, self._illegal_code, dtype=np.uint8
+        )
+        self._symbol_to_code[self._symbols] = np.arange(
+            len(self._symbols), dtype=np.uint8
+        )
+        # Used for fast decoding of single symbol codes in 'Sequence'
+        self._symbols_tuple = tuple(self.get_symbols())
+        # Translation table for 'bytes.translate()' that maps from
+        # symbol code to the ASCII value of the symbol:
+        # Used for fast decoding of sequence codes into strings
+        # Invalid codes are mapped to the NUL character,
+        # which is not printable and hence cannot be a symbol
+        code_to_ascii = bytearray(256)
+        code_to_ascii[:len(self._symbols)] = self._symbols.tobytes()
+        self._code_to_ascii = bytes(code_to_ascii)
     
     def get_symbols(self):
         """
@@ -326,12 +361,13 @@ class LetterAlphabet(Alphabet):
     def encode(self, symbol):
         if not isinstance(symbol, (str, bytes)) or len(symbol) > 1:
             raise AlphabetError(f"Symbol '{symbol}' is not a single letter")
-        indices = np.where(self._symbols == ord(symbol))[0]
-        if len(indices) == 0:
-            raise AlphabetError(
-                f"Symbol {repr(symbol)} is not in the alphabet"
-            )
-        return indices[0]
+        ascii_value = ord(symbol)
+        if ascii_value >= len(self._symbol_to_code) or \
+           self._symbol_to_code[ascii_value] == self._illegal_code:
+                raise AlphabetError(
+                    f"Symbol {repr(symbol)} is not in the alphabet"
+                )
+        return int(self._symbol_to_code[ascii_value])
     
     def decode(self, code, as_bytes=False):
         if code < 0 or code >= len(self._symbols):
@@ -369,7 +405,11 @@ class LetterAlphabet(Alphabet):
                 np.array(list(symbols), dtype="|S1"),
                 dtype=np.ubyte
             )
-        return encode_chars(alphabet=self._symbols, symbols=symbols)
+        return encode_chars(
+            symbol_to_code=self._symbol_to_code,
+            symbols=symbols,
+            illegal_code=self._illegal_code
+        )
     
     def decode_multiple(self, code, as_bytes=False):
         """
@@ -496,9 +536,10 @@ class AlphabetMapper(object):
 
     @staticmethod
     def _dtype(alphabet_size):
-        _size_uint8  = np.iinfo(np.uint8 ).max +1
-        _size_uint16 = np.iinfo(np.uint16).max +1
-        _size_uint32 = np.iinfo(np.uint32).max +1
+        # Equal to 'np.iinfo(np.uintX).max + 1'
+        _size_uint8  = 1 << 8
+        _size_uint16 = 1 << 16
+        _size_uint32 = 1 << 32
         if alphabet_size <= _size_uint8:
             return np.uint8
         elif alphabet_size <= _size_uint16:
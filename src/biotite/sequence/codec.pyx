@@ -21,8 +21,9 @@ ctypedef np.uint64_t uint64
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def encode_chars(const unsigned char[:] alphabet,
-                 const unsigned char[:] symbols):
+def encode_chars(const uint8[:] symbol_to_code,
+                 const unsigned char[:] symbols,
+                 uint8 illegal_code):
     """
     Encode an array of symbols into an array of symbol codes.
 
@@ -30,12 +31,17 @@ def encode_chars(const unsigned char[:] alphabet,
 
     Parameters
     ----------
-    alphabet : ndarray, shape=(n,), dtype="|S1"
-        The alphabet as array.
+    symbol_to_code : ndarray, shape=(256,), dtype=uint8
+        An array based map from symbol to code.
         It is indexed via ASCII values and the corresponding values are
         the symbol codes.
+        Characters that are not part of the alphabet are mapped to
+        `illegal_code`.
     symbols : ndarray, dtype="|S1"
         The symbols (ASCII characters) to be encoded.
+    illegal_code : uint8
+        The code that marks characters that are not part of the
+        alphabet in `symbol_to_code`.
     
     Returns
     -------
@@ -43,29 +49,13 @@ def encode_chars(const unsigned char[:] alphabet,
         The encoded symbols.
     """
     cdef int i
-    # The last symbol code of the alphabet + 1 is always illegal
-    # Since this code cannot occur from symbol encoding
-    # it can be later used to check for illegal symbols
-    cdef uint8 illegal_code = alphabet.shape[0]
-    # An array based map that maps from symbol to code
-    # Since the maximum value of a char is 256
-    # the size of the map is known at compile time
-    cdef uint8 sym_to_code[256]
-    # Initially fill the map with the illegal symbol
-    # Consequently, the map will later return the illegal symbol
-    # when indexed with a character that is not part of the alphabet
-    sym_to_code[:] = [illegal_code] * 256
-    # Then fill in entries for the symbols of the alphabet
-    cdef unsigned char symbol
-    for i, symbol in enumerate(alphabet):
-        sym_to_code[symbol] = i
     
     # Encode the symbols
     code = np.empty(symbols.shape[0], dtype=np.uint8)
     cdef uint8[:] code_view = code
     cdef uint8 symbol_code
     for i in range(symbols.shape[0]):
-        symbol_code = sym_to_code[symbols[i]]
+        symbol_code = symbol_to_code[symbols[i]]
         # Check if the symbols is valid
         if symbol_code == illegal_code:
             illegal_symbol = chr(symbols[i])
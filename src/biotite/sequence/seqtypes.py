@@ -25,6 +25,8 @@ class GeneralSequence(Sequence):
         The symbol sequence, the :class:`Sequence` is initialized with.
         For alphabets containing single letter strings, this parameter
         may also be a :class:`str` object.
+        For a :class:`LetterAlphabet`, this parameter may also be an
+        ASCII encoded :class:`bytes` object.
         By default the sequence is empty.
     """
         
@@ -80,7 +82,8 @@ class NucleotideSequence(Sequence):
     Parameters
     ----------
     sequence : iterable object, optional
-        The initial DNA sequence. This may either be a list or a string.
+        The initial DNA sequence. This may either be a list, a string
+        or ASCII encoded :class:`bytes`.
         May take upper or lower case letters.
         By default the sequence is empty.
     ambiguous : bool, optional
@@ -120,7 +123,7 @@ class NucleotideSequence(Sequence):
     _complement_func = np.vectorize(_compl_dict.__getitem__)
     
     def __init__(self, sequence=[], ambiguous=None):
-        if isinstance(sequence, str):
+        if isinstance(sequence, (str, bytes)):
             sequence = sequence.upper()
         else:
             sequence = [symbol.upper() for symbol in sequence]
@@ -313,8 +316,9 @@ class ProteinSequence(Sequence):
     Parameters
     ----------
     sequence : iterable object, optional
-        The initial protein sequence. This may either be a list or a
-        string. May take upper or lower case letters. If a list is
+        The initial protein sequence. This may either be a list, a
+        string or ASCII encoded :class:`bytes`.
+        May take upper or lower case letters. If a list is
         given, the list elements can be 1-letter or 3-letter amino acid
         representations. By default the sequence is empty.
     """
@@ -416,10 +420,16 @@ class ProteinSequence(Sequence):
     def __init__(self, sequence=()):
         dict_3to1 = ProteinSequence._dict_3to1
         alph = ProteinSequence.alphabet
-        # Convert 3-letter codes to single letter codes,
-        # if list contains 3-letter codes
-        sequence = [dict_3to1[symbol.upper()] if len(symbol) == 3
-                    else symbol.upper() for symbol in sequence]
+        if isinstance(sequence, (str, bytes)):
+            # A string contains only single letter codes
+            # -> Keep it as string, since strings are encoded
+            # much faster than lists of symbols
+            sequence = sequence.upper()
+        else:
+            # Convert 3-letter codes to single letter codes,
+            # if list contains 3-letter codes
+            sequence = [dict_3to1[symbol.upper()] if len(symbol) == 3
+                        else symbol.upper() for symbol in sequence]
         super().__init__(sequence)
     
     def get_alphabet(self):
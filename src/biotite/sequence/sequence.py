@@ -13,13 +13,20 @@ __all__ = ["Sequence"]
 import numbers
 import abc
 import numpy as np
-from .alphabet import Alphabet, LetterAlphabet
+from .alphabet import Alphabet, LetterAlphabet, AlphabetError
 from ..copyable import Copyable
 
 
-_size_uint8  = np.iinfo(np.uint8 ).max +1
-_size_uint16 = np.iinfo(np.uint16).max +1
-_size_uint32 = np.iinfo(np.uint32).max +1
+# Maps the number of bits required for the largest symbol code
+# to the smallest fitting unsigned integer type
+_CODE_DTYPES = (np.uint8,)  * (8  + 1) \
+             + (np.uint16,) * (16 - 8) \
+             + (np.uint32,) * (32 - 16) \
+             + (np.uint64,) * (64 - 32)
+
+# Below this size (in bytes) comparing the 'bytes' objects of sequence
+# codes is faster than 'np.array_equal()'
+_BYTES_COMPARISON_MAX_SIZE = 1 << 16
 
 
 class Sequence(Copyable, metaclass=abc.ABCMeta):
@@ -70,7 +77,11 @@ class Sequence(Copyable, metaclass=abc.ABCMeta):
     sequence : iterable object, optional
         The symbol sequence, the :class:`Sequence` is initialized with.
         For alphabets containing single letter strings, this parameter
-        may also be a :class`str` object.
+        may also be a :class:`str` object.
+        For a :class:`LetterAlphabet`, this parameter may also be an
+        ASCII encoded :class:`bytes` object.
+        This is the fastest way to create a sequence, as the bytes are
+        directly encoded into the sequence code.
         By default the sequence is empty.
     
     Attributes
@@ -144,6 +155,11 @@ class Sequence(Copyable, metaclass=abc.ABCMeta):
     """
     
     def __init__(self, sequence=()):
+        # The alphabet of a sequence does not change,
+        # hence the alphabet size and the resulting dtype of the
+        # sequence code are determined only once
+        self._alph_len = len(self.get_alphabet())
+        self._dtype_cached = Sequence._dtype(self._alph_len)
         self.symbols = sequence
         
     
@@ -180,8 +196,7 @@ class Sequence(Copyable, metaclass=abc.ABCMeta):
     @symbols.setter
     def symbols(self, value):
         alph = self.get_alphabet()
-        dtype = Sequence._dtype(len(alph))
-        self._seq_code = alph.encode_multiple(value, dtype)
+        self._seq_code = alph.encode_multiple(value, self._dtype_cached)
     
     @property
     def code(self):
@@ -189,10 +204,14 @@ class Sequence(Copyable, metaclass=abc.ABCMeta):
     
     @code.setter
     def code(self, value):
-        dtype = Sequence._dtype(len(self.get_alphabet()))
         if not isinstance(value, np.ndarray):
             raise TypeError("Sequence code must be an integer ndarray")
-        self._seq_code = value.astype(dtype, copy=False)
+        if value.dtype == self._dtype_cached:
+            # Skip the overhead of 'astype()' for the common case,
+            # that the code already has the correct dtype
+            self._seq_code = value
+        else:
+            self._seq_code = value.astype(self._dtype_cached, copy=False)
     
     @property
     def alphabet(self):
@@ -251,7 +270,13 @@ class Sequence(Copyable, metaclass=abc.ABCMeta):
         valid : bool
             True, if the sequence is valid, false otherwise.
         """
-        return (self.code < len(self.get_alphabet())).all()
+        if self._alph_len > np.iinfo(self._seq_code.dtype).max:
+            # Every value of the unsigned code dtype is a valid code
+            return True
+        if len(self._seq_code) == 0:
+            return True
+        # The maximum is computed without creating a boolean mask
+        return bool(self._seq_code.max() < self._alph_len)
     
     def get_symbol_frequency(self):
         """
@@ -267,79 +292,122 @@ class Sequence(Copyable, metaclass=abc.ABCMeta):
             corresponding number of occurences in the sequence as
             values.
         """
-        frequencies = {}
-        for code, symbol in enumerate(self.get_alphabet()):
-            frequencies[symbol] = len(np.nonzero((self._seq_code == code))[0])
-        return frequencies
+        # Count all symbol codes in a single pass over the sequence
+        counts = np.bincount(self._seq_code, minlength=self._alph_len)
+        return {
+            symbol: int(counts[code])
+            for code, symbol in enumerate(self.get_alphabet())
+        }
     
     def __getitem__(self, index):
-        alph = self.get_alphabet()
         sub_seq = self._seq_code.__getitem__(index)
         if isinstance(sub_seq, np.ndarray):
             return self.copy(sub_seq)
         else:
-            return alph.decode(sub_seq)
+            # Decode the symbol code directly without the overhead of
+            # 'Alphabet.decode()'
+            # Since the code is unsigned, only too large codes are
+            # invalid
+            try:
+                return self.get_alphabet()._symbols_tuple[sub_seq]
+            except IndexError:
+                raise AlphabetError(
+                    f"'{sub_seq:d}' is not a valid code"
+                ) from None
     
     def __setitem__(self, index, item):
-        alph = self.get_alphabet()
         if isinstance(index, numbers.Integral):
             # Expect a single symbol
-            code = alph.encode(item)
+            code = self.get_alphabet().encode(item)
+        elif type(item) is np.ndarray:
+            # Fast path for the common case of a given sequence code
+            # for multiple positions
+            code = item
         else:
             # Expect multiple symbols
             if isinstance(item, Sequence):
-                code = item.code
+                code = item._seq_code
             elif isinstance(item, np.ndarray):
                 code = item
             else:
                 # Default: item is iterable object of symbols
-                code = alph.encode_multiple(item)
-        self._seq_code.__setitem__(index, code)
+                code = self.get_alphabet().encode_multiple(
+                    item, self._dtype_cached
+                )
+        self._seq_code[index] = code
     
     def __len__(self):
         return len(self._seq_code)
     
     def __iter__(self):
-        alph = self.get_alphabet()
-        i = 0
-        while i < len(self):
-            yield alph.decode(self._seq_code[i])
-            i += 1
+        # Decode the entire sequence at once instead of decoding each
+        # symbol separately
+        symbols = self.get_alphabet().decode_multiple(self._seq_code)
+        if isinstance(symbols, np.ndarray):
+            # Iterating over a list is faster and yields 'str' objects
+            # instead of NumPy scalars
+            symbols = symbols.tolist()
+        return iter(symbols)
     
     def __eq__(self, item):
+        if item is self:
+            return True
         if not isinstance(item, type(self)):
             return False
+        # Cheap checks first, to avoid comparing the alphabets or
+        # the entire sequence code if possible
+        if len(self._seq_code) != len(item._seq_code):
+            return False
+        if self._alph_len != item._alph_len:
+            return False
         if self.get_alphabet() != item.get_alphabet():
             return False
-        return np.array_equal(self._seq_code, item._seq_code)
+        code1 = self._seq_code
+        code2 = item._seq_code
+        # Since the alphabets are equal, both sequence codes have the
+        # same dtype and can be compared bytewise
+        if code1.nbytes < _BYTES_COMPARISON_MAX_SIZE:
+            return code1.tobytes() == code2.tobytes()
+        else:
+            return np.array_equal(code1, code2)
     
     def __str__(self):
         alph = self.get_alphabet()
         if isinstance(alph, LetterAlphabet):
-            return alph.decode_multiple(self._seq_code, as_bytes=True)\
-                   .tobytes().decode("ASCII")
+            # The code of letter alphabet sequences is always 'uint8'
+            # -> the code bytes can be directly translated into
+            # ASCII characters
+            ascii_symbols = self._seq_code.tobytes().translate(
+                alph._code_to_ascii
+            )
+            # Invalid codes are translated into NUL characters
+            if b"\0" in ascii_symbols:
+                invalid_code = self._seq_code[self._seq_code >= len(alph)][0]
+                raise AlphabetError(f"'{invalid_code:d}' is not a valid code")
+            return ascii_symbols.decode("ASCII")
         else:
             return "".join(alph.decode_multiple(self._seq_code))
     
     def __add__(self, sequence):
         if self.get_alphabet().extends(sequence.get_alphabet()):
-            new_code = np.concatenate((self._seq_code, sequence._seq_code))
-            new_seq = self.copy(new_code)
-            return new_seq
+            parent = self
         elif sequence.get_alphabet().extends(self.get_alphabet()):
-            new_code = np.concatenate((self._seq_code, sequence._seq_code))
-            new_seq = sequence.copy(new_code)
-            return new_seq
+            parent = sequence
         else:
             raise ValueError("The sequences alphabets are not compatible")
+        # Allocate the concatenated sequence code directly with the
+        # dtype of the resulting sequence,
+        # so that no further conversion is necessary
+        length = len(self._seq_code)
+        new_code = np.empty(
+            length + len(sequence._seq_code), dtype=parent._dtype_cached
+        )
+        new_code[:length] = self._seq_code
+        new_code[length:] = sequence._seq_code
+        return parent.copy(new_code)
 
     @staticmethod
     def _dtype(alphabet_size):
-        if alphabet_size <= _size_uint8:
-            return np.uint8
-        elif alphabet_size <= _size_uint16:
-            return np.uint16
-        elif alphabet_size <= _size_uint32:
-            return np.uint32
-        else:
-            return np.uint64
+        # The largest symbol code is 'alphabet_size - 1'
+        bits = (alphabet_size - 1).bit_length()
+        return _CODE_DTYPES[min(bits, 64)]
@@ -287,6 +287,23 @@ def test_align_multiple(sequences, gap_penalty):
     )
     assert score >= ref_score * 0.5
 
+@pytest.mark.parametrize("gap_penalty", [-10, (-10,-1)])
+def test_align_multiple_threads(sequences, gap_penalty):
+    """
+    Test whether `align_multiple()` gives the same result independent
+    of the number of threads used for the pairwise alignments.
+    """
+    matrix = align.SubstitutionMatrix.std_protein_matrix()
+    ref_alignment, ref_order, _, ref_distances = align.align_multiple(
+        sequences, matrix, gap_penalty=gap_penalty, threads=1
+    )
+    alignment, order, _, distances = align.align_multiple(
+        sequences, matrix, gap_penalty=gap_penalty, threads=4
+    )
+    assert np.array_equal(distances, ref_distances)
+    assert np.array_equal(order, ref_order)
+    assert alignment == ref_alignment
+
 @pytest.mark.parametrize("db_entry", [entry for entry
                                       in align.SubstitutionMatrix.list_db()
                                       if entry not in ["NUC","GONNET"]])
@@ -94,6 +94,20 @@ def test_error(alphabet_symbols, use_letter_alphabet, is_single_val):
             alph.decode_multiple(np.array([-1]))
 
 
+def test_letter_alphabet_error(alphabet_symbols):
+    """
+    Characters outside of the ASCII range must raise an
+    :class:`AlphabetError` as well.
+    """
+    alph = seq.LetterAlphabet(alphabet_symbols)
+    with pytest.raises(seq.AlphabetError):
+        alph.encode("\u00c4")
+    with pytest.raises(seq.AlphabetError):
+        alph.encode("\u0100")
+    with pytest.raises(seq.AlphabetError):
+        alph.encode_multiple(b"AB\xff")
+
+
 @pytest.mark.parametrize(
     "symbols",
     ["ABC", b"ABC", ["A","B","C"],
@@ -18,6 +18,27 @@ def test_nucleotide_construction():
     assert str(dna) == string_amb
 
 
+def test_protein_construction():
+    string = "mlGhK*"
+    protein = seq.ProteinSequence(string)
+    assert str(protein) == string.upper()
+    protein = seq.ProteinSequence(["MET", "l", "gly", "H", "K", "*"])
+    assert str(protein) == string.upper()
+
+
+@pytest.mark.parametrize("seq_type, symbols", [
+    (seq.NucleotideSequence, "acgTA"),
+    (seq.NucleotideSequence, "ACGTN"),
+    (seq.ProteinSequence, "mlGhK*"),
+])
+def test_construction_from_bytes(seq_type, symbols):
+    ref_sequence = seq_type(symbols)
+    test_sequence = seq_type(symbols.encode("ASCII"))
+    assert test_sequence == ref_sequence
+    with pytest.raises(seq.AlphabetError):
+        seq_type(b"AC\xe4")
+
+
 def test_reverse_complement():
     string = "AATGCGTTA"
     dna = seq.NucleotideSequence(string)
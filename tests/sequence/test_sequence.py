@@ -19,6 +19,12 @@ def test_validity_check():
     assert dna.is_valid()
     dna.code = np.array([0,1,4,3,3])
     assert not dna.is_valid()
+    dna.code = np.array([], dtype=int)
+    assert dna.is_valid()
+    # Alphabet that covers the entire value range of the code dtype
+    general_seq = seq.GeneralSequence(seq.Alphabet(np.arange(256)))
+    general_seq.code = np.arange(256)
+    assert general_seq.is_valid()
     
 def test_access():
     string = "AATGCGTTA"
@@ -53,11 +59,29 @@ def test_concatenation():
     assert str1 + str3 == str(concat_seq)
     concat_seq = seq.NucleotideSequence(str3) + seq.NucleotideSequence(str1)
     assert str3 + str1 == str(concat_seq)
+    # Alphabets with different code dtypes
+    alph1 = seq.Alphabet(np.arange(10))
+    alph2 = seq.Alphabet(np.arange(1000))
+    seq1 = seq.GeneralSequence(alph1, [1, 2, 3])
+    seq2 = seq.GeneralSequence(alph2, [999, 500])
+    concat_seq = seq1 + seq2
+    assert concat_seq.get_alphabet() == alph2
+    assert concat_seq.code.dtype == np.uint16
+    assert concat_seq.code.tolist() == [1, 2, 3, 999, 500]
+    with pytest.raises(ValueError):
+        seq.NucleotideSequence(str1) + seq.ProteinSequence(str1)
     
 def test_alph_error():
     string = "AATGCGTUTA"
     with pytest.raises(seq.AlphabetError):
         seq.NucleotideSequence(string)
+    # A single position expects a symbol, even if an array is given
+    dna = seq.NucleotideSequence("ACGTA")
+    with pytest.raises(seq.AlphabetError):
+        dna[0] = np.array([2])
+    with pytest.raises(seq.AlphabetError):
+        dna[0] = np.array("A")
+    assert str(dna) == "ACGTA"
 
 def test_alphabet_extension():
     alph1 = seq.Alphabet("abc")
@@ -68,4 +92,93 @@ def test_alphabet_extension():
     assert alph2.extends(alph1)
     assert not alph3.extends(alph1)
     assert alph4.extends(alph1)
-    assert not alph1.extends(alph4)
\ No newline at end of file
+    assert not alph1.extends(alph4)
+
+def test_general_encoding():
+    alph = seq.Alphabet(["A", "C", "G", "T", "foo"])
+    symbols = ["foo", "A", "T", "foo", "G", "C"]
+    general_seq = seq.GeneralSequence(alph, symbols)
+    assert general_seq.symbols == symbols
+    assert str(general_seq) == "".join(symbols)
+
+
+def test_iteration():
+    string = "AATGCGTTA"
+    dna = seq.NucleotideSequence(string)
+    symbols = list(dna)
+    assert symbols == list(string)
+    assert all(type(symbol) == str for symbol in symbols)
+    alph = seq.Alphabet(["A", 42, "foo"])
+    general_seq = seq.GeneralSequence(alph, [42, "foo", "A", 42])
+    assert list(general_seq) == [42, "foo", "A", 42]
+
+
+def test_symbol_frequency():
+    dna = seq.NucleotideSequence("AATGCGTTA")
+    assert dna.get_symbol_frequency() == {"A": 3, "C": 1, "G": 2, "T": 3}
+    dna = seq.NucleotideSequence("")
+    assert dna.get_symbol_frequency() == {"A": 0, "C": 0, "G": 0, "T": 0}
+
+
+def test_reverse():
+    dna = seq.NucleotideSequence("AATGCGTTA")
+    dna_rev = dna.reverse()
+    assert str(dna_rev) == "ATTGCGTAA"
+    # The reversed sequence must not share memory with the original one
+    dna_rev[0] = "C"
+    assert str(dna) == "AATGCGTTA"
+
+
+def test_equality():
+    dna = seq.NucleotideSequence("AATGCGTTA")
+    assert dna == dna
+    assert dna == seq.NucleotideSequence("AATGCGTTA")
+    assert dna != seq.NucleotideSequence("AATGCGTTC")
+    assert dna != seq.NucleotideSequence("AATGCGTT")
+    assert dna != seq.NucleotideSequence("AATGCGTTA", ambiguous=True)
+    assert dna != "AATGCGTTA"
+
+
+@pytest.mark.parametrize("seq_length", [10, 100000])
+@pytest.mark.parametrize("contiguous", [False, True])
+def test_code_equality(seq_length, contiguous):
+    """
+    Test equality check for the different comparison methods depending
+    on the sequence length and memory layout.
+    """
+    np.random.seed(0)
+    code = np.random.randint(4, size=2 * seq_length)
+    if not contiguous:
+        code = code.astype(np.uint8)[::2]
+    dna1 = seq.NucleotideSequence()
+    dna1.code = code
+    dna2 = seq.NucleotideSequence()
+    dna2.code = code.copy()
+    assert dna1.code.flags.c_contiguous == contiguous
+    assert dna1 == dna2
+    dna2[-1] = "A" if dna2[-1] != "A" else "C"
+    assert dna1 != dna2
+
+
+def test_invalid_access():
+    dna = seq.NucleotideSequence()
+    dna.code = np.array([0,1,4,3,3])
+    assert dna[1] == "C"
+    with pytest.raises(seq.AlphabetError) as excinfo:
+        dna[2]
+    # The internal lookup error is not exposed
+    assert excinfo.value.__context__ is None or \
+        excinfo.value.__suppress_context__
+    with pytest.raises(seq.AlphabetError):
+        str(dna)
+
+
+@pytest.mark.parametrize("alphabet_size, exp_dtype", [
+    (1, np.uint8), (4, np.uint8), (256, np.uint8),
+    (257, np.uint16), (65536, np.uint16), (65537, np.uint32)
+])
+def test_code_dtype(alphabet_size, exp_dtype):
+    alph = seq.Alphabet(range(alphabet_size))
+    general_seq = seq.GeneralSequence(alph, [0, alphabet_size - 1])
+    assert general_seq.code.dtype == exp_dtype
+    assert general_seq.symbols == [0, alphabet_size - 1]
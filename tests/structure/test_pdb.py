@@ -3,6 +3,7 @@
 # information.
 
 from tempfile import TemporaryFile
+import functools
 import itertools
 import glob
 from os.path import join, splitext
@@ -18,6 +19,36 @@ import biotite.structure.io as io
 from ..util import data_dir
 
 
+@pytest.fixture(scope="session")
+def read_structure():
+    """
+    Get a function that parses the structure of the given model from a
+    PDB file.
+
+    As multiple tests use the same files, each combination of file and
+    model is parsed only once per session.
+    This includes combinations that raise an
+    :class:`InvalidFileError`, which is raised again on each call.
+    Hence, the returned structures must not be modified by the tests.
+    """
+    @functools.lru_cache(maxsize=None)
+    def _read_structure_or_error(path, model):
+        pdb_file = pdb.PDBFile.read(path)
+        try:
+            return pdb.get_structure(pdb_file, model=model), None
+        except biotite.InvalidFileError as e:
+            # 'lru_cache()' does not cache raised exceptions
+            return None, e
+    
+    def _read_structure(path, model):
+        structure, error = _read_structure_or_error(path, model)
+        if error is not None:
+            raise error
+        return structure
+    
+    return _read_structure
+
+
 def test_get_model_count():
     pdb_file = pdb.PDBFile.read(join(data_dir("structure"), "1l2y.pdb"))
     # Test also the thin wrapper around the method
@@ -35,12 +66,11 @@ def test_get_model_count():
         [False, True]
     )
 )
-def test_array_conversion(path, model, hybrid36):
-    pdb_file = pdb.PDBFile.read(path)
+def test_array_conversion(read_structure, path, model, hybrid36):
     # Test also the thin wrapper around the methods
     # 'get_structure()' and 'set_structure()'
     try:
-        array1 = pdb.get_structure(pdb_file, model=model)
+        array1 = read_structure(path, model)
     except biotite.InvalidFileError:
         if model is None:
             # The file cannot be parsed into an AtomArrayStack,
@@ -81,11 +111,10 @@ def test_array_conversion(path, model, hybrid36):
         [None, 1, -1]
     )
 )
-def test_pdbx_consistency(path, model):
+def test_pdbx_consistency(read_structure, path, model):
     cif_path = splitext(path)[0] + ".cif"
-    pdb_file = pdb.PDBFile.read(path)
     try:
-        a1 = pdb_file.get_structure(model=model)
+        a1 = read_structure(path, model)
     except biotite.InvalidFileError:
         if model is None:
             # The file cannot be parsed into an AtomArrayStack,
@@ -170,10 +199,9 @@ def test_guess_elements():
         [None, 1, -1]
     )
 )
-def test_box_shape(path, model):
-    pdb_file = pdb.PDBFile.read(path)
+def test_box_shape(read_structure, path, model):
     try:
-        a = pdb_file.get_structure(model=model)
+        a = read_structure(path, model)
     except biotite.InvalidFileError:
         if model is None:
             # The file cannot be parsed into an AtomArrayStack,
@@ -257,14 +285,14 @@ def test_id_overflow():
 
 
 @pytest.mark.parametrize("model", [None, 1, 10])
-def test_get_coord(model):
+def test_get_coord(read_structure, model):
     # Choose a structure without inscodes and altlocs
     # to avoid atom filtering in reference atom array (stack)
     path = join(data_dir("structure"), "1l2y.pdb")
     pdb_file = pdb.PDBFile.read(path)
     
     try:
-        ref_coord = pdb_file.get_structure(model=model).coord
+        ref_coord = read_structure(path, model).coord
     except biotite.InvalidFileError:
         if model is None:
             # The file cannot be parsed into an AtomArrayStack,
@@ -280,25 +308,23 @@ def test_get_coord(model):
     assert (test_coord == ref_coord).all()
 
 
-np.random.seed(0)
-N = 200
-LENGTHS = [3, 4, 5]
-@pytest.mark.parametrize(
-    "number, length",
-    zip(
-        list(itertools.chain(*[
-            np.random.randint(0, hybrid36.max_hybrid36_number(length), N)
-            for length in LENGTHS
-        ])),
-        list(itertools.chain(*[
-            [length] * N for length in LENGTHS
-        ]))
-    )
-)
-def test_hybrid36_codec(number, length):
-    string = hybrid36.encode_hybrid36(number, length)
-    test_number = hybrid36.decode_hybrid36(string)
-    assert test_number == number
+@pytest.mark.parametrize("length", [3, 4, 5])
+def test_hybrid36_codec(length):
+    """
+    Test whether random numbers are still the same after encoding and
+    decoding them via hybrid-36 notation.
+    All numbers are checked in a single test case per length, as the
+    overhead of a separate test case for each number by far exceeds the
+    actual computation time.
+    """
+    N = 200
+    np.random.seed(0)
+    numbers = np.random.randint(0, hybrid36.max_hybrid36_number(length), N)
+    test_numbers = np.array([
+        hybrid36.decode_hybrid36(hybrid36.encode_hybrid36(number, length))
+        for number in numbers
+    ])
+    assert test_numbers.tolist() == numbers.tolist()
 
 
 def test_max_hybrid36_number():